@@ -14,9 +14,10 @@ class FaceTracker:
             min_detection_confidence=min_detection_confidence or config.FACE_DETECTION_CONFIDENCE
         )
     
-    def find_faces(self, img, draw=None):
-        """Find faces in an image and optionally draw the detections."""
-        imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    def find_faces(self, img, draw=None, imgRGB=None):
+        """Find faces in an image and optionally draw the detections. Reuses imgRGB if already converted."""
+        if imgRGB is None:
+            imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
         self.results = self.face_detection.process(imgRGB)
         
         faces = []
@@ -0,0 +1,39 @@
+import numpy as np
+
+
+class FrameBufferPool:
+    """Preallocated frame buffers reused by every stage of the per-frame pipeline."""
+
+    def __init__(self, width, height, display_size):
+        """Allocate camera-sized and display-sized buffers up front."""
+        self.allocations = 0
+        self._buffers = {}
+
+        self.frame_shape = (height, width, 3)
+        self.display_shape = (display_size[1], display_size[0], 3)
+        for name in ('raw', 'frame', 'rgb'):
+            self.get(name, self.frame_shape)
+        self.get('display', self.display_shape)
+        self._reported_allocations = self.allocations
+
+    def get(self, name, shape):
+        """Return the named buffer, allocating it only if missing or the wrong shape."""
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+            self._buffers[name] = buffer
+            self.allocations += 1
+        return buffer
+
+    def store(self, name, result):
+        """Keep a stage output; counts an allocation if OpenCV did not write into the pooled buffer."""
+        if self._buffers.get(name) is not result:
+            self._buffers[name] = result
+            self.allocations += 1
+        return result
+
+    def new_allocations(self):
+        """Return the number of allocations since the previous call."""
+        count = self.allocations - self._reported_allocations
+        self._reported_allocations = self.allocations
+        return count
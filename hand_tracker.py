@@ -22,9 +22,10 @@ class HandTracker:
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
     
-    def find_hands(self, img, draw=None):
-        """Find hands in an image and optionally draw the landmarks."""
-        imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    def find_hands(self, img, draw=None, imgRGB=None):
+        """Find hands in an image and optionally draw the landmarks. Reuses imgRGB if already converted."""
+        if imgRGB is None:
+            imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
         self.results = self.hands.process(imgRGB)
         
         if self.results.multi_hand_landmarks and (draw if draw is not None else config.SHOW_HAND_LANDMARKS):
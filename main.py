@@ -6,6 +6,7 @@ from datetime import datetime
 import configurations as config
 from drawing_canvas import DrawingCanvas
 from face_tracker import FaceTracker
+from frame_buffers import FrameBufferPool
 from hand_tracker import HandTracker
 from sound_manager import play_background
 
@@ -28,6 +29,7 @@ class PaintLivecam:
         self.hand_tracker = HandTracker()
         self.face_tracker = FaceTracker()
         self.canvas = DrawingCanvas(w, h)
+        self.buffers = FrameBufferPool(w, h, config.WINDOW_SIZE)
         
         # Setup display window
         cv2.namedWindow(config.WINDOW_NAME, cv2.WINDOW_NORMAL)
@@ -127,18 +129,22 @@ class PaintLivecam:
         """Main application loop."""
         try:
             while True:
-                # Capture and prepare frame
-                success, img = self.cap.read()
+                # Capture and prepare frame into pooled buffers
+                success, raw = self.cap.read(self.buffers.get('raw', self.buffers.frame_shape))
                 if not success:
                     print("Camera disconnected!")
                     break
+                raw = self.buffers.store('raw', raw)
                 
-                img = cv2.flip(img, 1)  # Mirror for intuitive interaction
+                # Mirror for intuitive interaction
+                img = self.buffers.store('frame', cv2.flip(raw, 1, dst=self.buffers.get('frame', raw.shape)))
+                img_rgb = self.buffers.store('rgb', cv2.cvtColor(img, cv2.COLOR_BGR2RGB,
+                                                                 dst=self.buffers.get('rgb', img.shape)))
                 
-                # Detect hands and faces
-                img = self.hand_tracker.find_hands(img)
+                # Detect hands and faces (single shared RGB conversion)
+                img = self.hand_tracker.find_hands(img, imgRGB=img_rgb)
                 hand_landmarks = self.hand_tracker.find_position(img)
-                img, faces = self.face_tracker.find_faces(img)
+                img, faces = self.face_tracker.find_faces(img, imgRGB=img_rgb)
                 
                 # Update canvas with face information
                 self.canvas.update_faces(faces)
@@ -147,16 +153,19 @@ class PaintLivecam:
                 
                 # Process hand input
                 if hand_landmarks:
-                    self.canvas.current_camera_img = img.copy()  # For saving
+                    # Save snapshot is only copied if the Save button fires below,
+                    # so finger indicators are drawn after input handling
+                    self.canvas.current_camera_img = img
                     positions = self._extract_finger_positions(hand_landmarks)
-                    self._draw_finger_indicators(img, positions)
                     self._process_hand_input(positions)
+                    self._draw_finger_indicators(img, positions)
                 else:
                     self.canvas.stop_drawing()
                 
                 # Render drawing and UI
                 self.canvas.draw_on_canvas()
-                img = cv2.addWeighted(img, 0.8, self.canvas.canvas, config.CANVAS_OPACITY, 0)
+                img = self.buffers.store('frame', cv2.addWeighted(img, 0.8, self.canvas.canvas,
+                                                                  config.CANVAS_OPACITY, 0, dst=img))
                 img = self.canvas.draw_ui(img)
                 
                 # Add information overlay
@@ -167,8 +176,14 @@ class PaintLivecam:
                     break
                 
                 # Display result
-                display_img = cv2.resize(img, config.WINDOW_SIZE)
+                display_img = self.buffers.store('display', cv2.resize(
+                    img, config.WINDOW_SIZE, dst=self.buffers.get('display', self.buffers.display_shape)))
                 cv2.imshow(config.WINDOW_NAME, display_img)
+                
+                # Steady state should reuse pooled buffers without new allocations
+                new_allocations = self.buffers.new_allocations()
+                if new_allocations:
+                    print(f"Frame buffers reallocated: {new_allocations} (total {self.buffers.allocations})")
         
         finally:
             self.cleanup()